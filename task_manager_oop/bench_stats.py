@@ -0,0 +1,64 @@
+'''
+bench_stats.py
+
+This module times the statistics counting of task_manager.py
+on a generated task file with an increasing number of processes.
+Usage:
+    python bench_stats.py [number of tasks]
+'''
+# ===== Importing external modules ===========
+import os
+import sys
+import tempfile
+import time
+
+from task_manager import count_tasks
+
+# ===== Define variables used in functions ====
+bench_users = [f"user{i}" for i in range(100)]
+bench_dates = ["01 Jan 2020", "15 Jun 2024", "20 Oct 2030", "03 Mar 2040"]
+
+
+def write_tasks(path, num_tasks):
+    '''Writes num_tasks generated tasks to path'''
+    with open(path, "w", encoding="utf-8") as task_file:
+        for i in range(num_tasks):
+            task_file.write(f"{bench_users[i % len(bench_users)]}, "
+                            f"Task{i}, Generated task number {i}, "
+                            f"01 Jan 2020, "
+                            f"{bench_dates[i % len(bench_dates)]}, "
+                            f"{'Yes' if i % 3 == 0 else 'No'}\n")
+
+
+def main():
+    num_tasks = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 7
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tasks.txt")
+        write_tasks(path, num_tasks)
+        print(f"{num_tasks} tasks, "
+              f"{os.path.getsize(path) / 2 ** 20:.1f} MiB")
+        # Powers of two up to the number of cores, always ending on it
+        num_cores = os.cpu_count() or 1
+        worker_counts = [2 ** i for i in range(num_cores.bit_length())
+                         if 2 ** i < num_cores] + [num_cores]
+        base_time = None
+        base_counts = None
+        for workers in worker_counts:
+            start = time.perf_counter()
+            user_counts = count_tasks([path], workers)
+            elapsed = time.perf_counter() - start
+            base_time = base_time or elapsed
+            base_counts = base_counts or user_counts
+            # Splitting the work must not change the result
+            if user_counts != base_counts:
+                sys.exit(f"workers: {workers} counted different totals "
+                         "than 1 worker")
+            print(f"workers: {workers:3}\t"
+                  f"time: {elapsed:8.2f}s\t"
+                  f"tasks/s: {num_tasks / elapsed:12.0f}\t"
+                  f"speedup: {base_time / elapsed:5.2f}\t"
+                  f"efficiency: {base_time / elapsed / workers:5.2f}")
+
+
+if __name__ == "__main__":
+    main()
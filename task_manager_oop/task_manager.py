@@ -7,6 +7,12 @@ It allows tracking and updating of tasks.
 It generates user and task reports for admin.
 '''
 # ===== Importing external modules ===========
+import hashlib  # Detects changed workspace files
+import os
+import sys
+import time
+from collections import OrderedDict  # Least recently used workspaces
+from concurrent.futures import ProcessPoolExecutor  # Parallel stats
 from tabulate import tabulate  # Assists with user friendly output
 from datetime import date  # Allows processing of dates
 from datetime import datetime
@@ -155,60 +161,236 @@ class Task:
             return False
 
 
-# ===== Define variables used in functions ====
-# assign empty username directory
-usernames = {}
-# assign empty task list
-tasks = []
-#  assign file paths
-path_users = "./user.txt"
-path_tasks = "./tasks.txt"
+class Workspace:
+    '''A team's users and tasks, kept in their own directory'''
+    def __init__(self, directory="."):
+        '''Contructs the class Workspace
+        Attributes
+            directory (str):    Directory with user.txt and tasks.txt.
+                                Default is the current directory.
+            usernames (dict):   Username as key and password as value.
+            tasks (list):       Task classes read from tasks.txt.
+            size (int):         Estimated memory use in bytes.
+        '''
+        self.directory = directory
+        self.path_users = os.path.join(directory, "user.txt")
+        self.path_tasks = os.path.join(directory, "tasks.txt")
+        self.usernames = {}
+        self.tasks = []
+        self.size = 0
+        # (modification time, size, hash) of each file when last read,
+        # the hash is only kept for recently modified files
+        self.users_stamp = None
+        self.tasks_stamp = None
+
+    def file_hash(self, path):
+        '''Returns a hash of the contents of path'''
+        digest = hashlib.blake2b()
+        with open(path, "rb") as file:
+            for block in iter(lambda: file.read(1 << 20), b""):
+                digest.update(block)
+        return digest.digest()
+
+    def is_recent(self, stat):
+        '''Returns True if another edit could still keep the same
+        modification time on filesystems with coarse timestamps'''
+        return time.time_ns() - stat.st_mtime_ns < mtime_granularity_ns
+
+    def file_stamp(self, path):
+        '''Returns (modification time, size, hash) of path or None.
+        Only recently modified files are hashed.'''
+        try:
+            stat = os.stat(path)
+            digest = self.file_hash(path) if self.is_recent(stat) else None
+            return (stat.st_mtime_ns, stat.st_size, digest)
+        # An unreadable file is treated as a missing one
+        except OSError:
+            return None
+
+    def check_stamp(self, path, stamp):
+        '''
+        Checks whether path is unchanged since stamp was taken.
+        Modification time and size are compared first, the file is
+        only hashed if it was stamped while its timestamp was recent.
+        Args:
+            path (str):     The file to check.
+            stamp (tuple):  The stamp taken when the file was read.
+        Returns:
+            stamp (tuple): The stamp to keep, or None if path changed.
+        '''
+        if stamp is None:
+            return None
+        try:
+            stat = os.stat(path)
+            if (stat.st_mtime_ns, stat.st_size) != stamp[:2]:
+                return None
+            if stamp[2] is None:
+                return stamp
+            if self.file_hash(path) != stamp[2]:
+                return None
+            # Later edits will change the timestamp, stop hashing
+            if not self.is_recent(stat):
+                return stamp[:2] + (None,)
+            return stamp
+        except OSError:
+            return None
+
+    def read_users(self):
+        '''Reads all the users from user.txt into dictionary usernames.
+        Skipped if user.txt has not changed since it was last read.'''
+        stamp = self.check_stamp(self.path_users, self.users_stamp)
+        if stamp is not None:
+            self.users_stamp = stamp
+            return
+        stamp = self.file_stamp(self.path_users)
+        self.usernames = {}
+        self.users_stamp = None
+        try:
+            # open user.txt and read usernames and passwords into directory
+            with open(self.path_users, "r", encoding="utf-8") as user_file:
+                for line in user_file:
+                    # split line into words found in a list
+                    words = line.split(", ")
+                    # assign username as key and password as value
+                    self.usernames[words[0]] = words[1].strip("\n")
+            self.users_stamp = stamp
+        # the file is missing, a directory or unreadable
+        except OSError as error:
+            print("'user.txt' file could not be read")
+            print(error)
+        self.update_size()
 
+    def read_tasks(self):
+        '''
+        Reads all task information from tasks.txt.
+        Constructs a class for each task.
+        Creates a list (tasks) of all the Task classes.
+        Skipped if tasks.txt has not changed since it was last read.
+        '''
+        stamp = self.check_stamp(self.path_tasks, self.tasks_stamp)
+        if stamp is not None:
+            self.tasks_stamp = stamp
+            return
+        stamp = self.file_stamp(self.path_tasks)
+        self.tasks = []
+        self.tasks_stamp = None
+        try:
+            with open(self.path_tasks, "r", encoding="utf-8") as task_file:
+                for line in task_file:
+                    # Make sure there is no \n in the string
+                    line = line.strip("\n")
+                    # Skip blank lines left behind by appending to the file
+                    if not line:
+                        continue
+                    # Separate items by ,
+                    words = line.split(", ")
+                    # Add to task list
+                    self.tasks.append(Task(words[0], words[1], words[2],
+                                           words[3], words[4], words[5]))
+            self.tasks_stamp = stamp
+        except OSError as error:
+            print("'tasks.txt' could not be read")
+            print(error)
+        self.update_size()
 
-# ==== Non-Class Functions ====================
-def read_users():
-    '''Reads all the users from user.txt into dictionary usernames'''
-    try:
-        global usernames
-        usernames = {}
-        # open user.txt and read usernames and passwords into directory
-        with open(path_users, "r", encoding="utf-8") as user_file:
-            for line in user_file:
-                # split line into words found in a list
-                words = line.split(", ")
-                # assign username as key and password as value
-                usernames[words[0]] = words[1].strip("\n")
-    # raise a FileNotFoundError if the file is not found
-    except FileNotFoundError as error:
-        print("'user.txt' file was not found")
-        print(error)
+    def update_tasks_file(self):
+        '''Updates task file with new task list.
+        If the write fails the next read reloads tasks.txt, so that
+        unsaved changes are not kept.'''
+        try:
+            with open(self.path_tasks, "w") as tasks_file:
+                for task in self.tasks:
+                    tasks_file.write(f"{task}\n")
+            # The loaded tasks now match the file
+            self.tasks_stamp = self.file_stamp(self.path_tasks)
+            self.update_size()
+        except OSError as error:
+            self.tasks_stamp = None
+            print("tasks.txt could not be written")
+            print(error)
+
+    def update_size(self):
+        '''Estimates the memory held by usernames and tasks.
+        The text is counted from the file sizes and every task is
+        assumed to be laid out like the first, so that saving does
+        not walk every task.'''
+        size = sys.getsizeof(self.usernames) + sys.getsizeof(self.tasks)
+        for stamp in (self.users_stamp, self.tasks_stamp):
+            if stamp is not None:
+                size += stamp[1]
+        # Each username and password is a string of its own
+        size += len(self.usernames) * 2 * sys.getsizeof("")
+        if self.tasks:
+            task = self.tasks[0]
+            task_size = (sys.getsizeof(task) + sys.getsizeof(task.__dict__)
+                         + len(task.__dict__) * sys.getsizeof(""))
+            size += len(self.tasks) * task_size
+        self.size = size
+
+
+class WorkspaceStore:
+    '''Keeps recently used workspaces loaded, within a memory budget'''
+    def __init__(self, memory_budget=None):
+        '''Contructs the class WorkspaceStore
+        Attributes
+            memory_budget (int):    Bytes that loaded workspaces may use.
+                                    Default is workspace_memory_budget.
+            workspaces (dict):      Directory as key and Workspace as
+                                    value, least recently used first.
+        '''
+        self.memory_budget = memory_budget or workspace_memory_budget
+        self.workspaces = OrderedDict()
 
+    def get(self, directory="."):
+        '''
+        Returns the workspace for directory, loading it if needed.
+        Args:
+            directory (str): Directory with user.txt and tasks.txt.
+        Returns:
+            workspace (Workspace): The up to date workspace, or None
+                                   if directory has no user.txt.
+        '''
+        # The same team may be reached through different paths
+        directory = os.path.realpath(directory)
+        # Only directories that hold a user.txt are workspaces
+        if not os.path.isfile(os.path.join(directory, "user.txt")):
+            self.workspaces.pop(directory, None)
+            print(f"No 'user.txt' found in workspace {directory}")
+            return None
+        workspace = self.workspaces.pop(directory, None)
+        if workspace is None:
+            workspace = Workspace(directory)
+        # Only rereads files that changed since the last request
+        workspace.read_users()
+        workspace.read_tasks()
+        self.workspaces[directory] = workspace
+        self.evict()
+        return workspace
+
+    def memory_size(self):
+        '''Returns the estimated bytes used by all loaded workspaces'''
+        return sum(workspace.size for workspace in self.workspaces.values())
+
+    def evict(self):
+        '''Drops the least recently used workspaces until within budget.
+        The most recently used workspace is always kept.'''
+        while (len(self.workspaces) > 1
+               and self.memory_size() > self.memory_budget):
+            self.workspaces.popitem(last=False)
 
-def read_tasks():
-    '''
-    Reads all task information from tasks.txt.
-    Constructs a class for each task.
-    Creates a list (tasks) of all the Task classes
-    '''
-    global tasks
-    tasks = []
-    try:
-        with open(path_tasks, "r", encoding="utf-8") as task_file:
-            for line in task_file:
-                # Make sure there is no \n in the string
-                line = line.strip("\n")
-                # Separate items by ,
-                words = line.split(", ")
-                # Add to task list
-                tasks.append(Task(words[0], words[1], words[2], words[3],
-                             words[4], words[5]))
 
-    except FileNotFoundError as error:
-        print("'tasks.txt' not found")
-        print(error)
+# ===== Define variables used in functions ====
+# Task files are split into chunks of this many bytes for statistics
+min_chunk_size = 1 << 20
+max_chunk_size = 1 << 25
+# Edits within this time may keep a file's modification time (FAT: 2s)
+mtime_granularity_ns = 2 * 10 ** 9
+# Memory that loaded workspaces may use before idle ones are dropped
+workspace_memory_budget = 1 << 30
 
 
-def reg_user():
+# ==== Non-Class Functions ====================
+def reg_user(workspace):
     '''
     Requests the relevant fields from user.
     Ensures no duplicate usernames.
@@ -219,7 +401,7 @@ def reg_user():
         # Request new username
         new_username = input("Please enter your username:\n\t")
         # Check for duplicate usernames
-        if new_username in usernames:
+        if new_username in workspace.usernames:
             print("This username is already taken. Please try another.")
             continue
         else:
@@ -233,7 +415,7 @@ def reg_user():
         # Add new user to text file
         if new_password == confirm_password:
             try:
-                with open(path_users, "a") as user_file:
+                with open(workspace.path_users, "a") as user_file:
                     string = f"\n{new_username}, {new_password}"
                     user_file.write(string)
                     print(f"\nNew user {new_username} has been added.\n")
@@ -245,20 +427,20 @@ def reg_user():
             print("Confirmation password does not match. Please try again")
 
 
-def add_task():
+def add_task(workspace):
     '''
     Add new task to task list.
     Updates tasks.txt
     '''
-    read_tasks()
-    read_users()
+    workspace.read_tasks()
+    workspace.read_users()
     # This code block allows a user to add a new task to task.txt file
     print("\nADD NEW TASK")
     # Prompt user for username for assignment
     while True:  # Ensure valid username
         user_task = input("Please enter the username for the person\n"
                           "that you would like to assign the task to:\n\t")
-        if user_task in usernames:
+        if user_task in workspace.usernames:
             break
         else:
             print("Username not found. Please enter a valid username")
@@ -283,53 +465,45 @@ def add_task():
         else:
             break
     # Add new task to list
-    tasks.append(Task(user_task, task_title, task_description, due_date))
+    workspace.tasks.append(Task(user_task, task_title, task_description,
+                                due_date))
 
     # Write updated task list to file
     try:
-        with open(path_tasks, "a") as task_file:
-            task_file.write(f"\n{tasks[-1]}")
+        with open(workspace.path_tasks, "a") as task_file:
+            task_file.write(f"\n{workspace.tasks[-1]}")
             print(f"\n{task_title} has been added.")
-    except FileNotFoundError as error:
-        print('tasks.txt not found')
+    except OSError as error:
+        # Reload tasks.txt next time rather than keep the unsaved task
+        workspace.tasks_stamp = None
+        print('tasks.txt could not be written')
         print(error)
 
 
-def view_all():
+def view_all(workspace):
     '''
     Displays all tasks in an user-friendly manner
     '''
     # Ensure updated list
-    read_tasks()
+    workspace.read_tasks()
     print("\nVIEW ALL TASKS")
-    for i, task in enumerate(tasks):
+    for i, task in enumerate(workspace.tasks):
         print('_' * 50)  # Print seperation line
         print(f"Task number:\t\t{i}\n")
         print(task.pretty_output())
         print('_' * 50)
 
 
-def update_tasks_file():
-    # Updates task file with new task list
-    try:
-        with open(path_tasks, "w") as tasks_file:
-            for task in tasks:
-                tasks_file.write(f"{task}\n")
-    except FileNotFoundError as error:
-        print("tasks.txt was not found")
-        print(error)
-
-
-def view_mine():
+def view_mine(workspace, username):
     '''
     Only displays logged in user's assigned tasks.
     Allows for updating.
     '''
     print("\nVIEW MY TASKS")
-    read_tasks()
+    workspace.read_tasks()
     my_tasks = []
     task_count = 0
-    for task_num, task in enumerate(tasks):
+    for task_num, task in enumerate(workspace.tasks):
         if username == task.get_username():
             # Make sure displayed task number correlates with task list
             # Create list that keeps record of relevant task numbers
@@ -351,7 +525,7 @@ def view_mine():
             # Make sure selected task is relevant to user
             elif selection in my_tasks:
                 # Only incompleted tasks can be edited
-                if tasks[selection].is_completed() is True:
+                if workspace.tasks[selection].is_completed() is True:
                     print("Only incomplete tasks can be edited, please "
                           "select another task.")
                     continue
@@ -371,9 +545,9 @@ def view_mine():
                               "ed \t- edit\n\t").lower()
         # Selected mark complete
         if update_option == "mc":
-            tasks[selection].mark_complete()
+            workspace.tasks[selection].mark_complete()
             # Communicate succesful update
-            print(f"{tasks[selection].pretty_output()}")
+            print(f"{workspace.tasks[selection].pretty_output()}")
             break
         elif update_option == "ed":
             while True:
@@ -385,11 +559,12 @@ def view_mine():
                     while True:
                         new_username = input("Please enter the username that"
                                              "the task is assigned to:\n\t")
-                        read_users()
+                        workspace.read_users()
                         # Ensure valid username
-                        if new_username in usernames:
-                            tasks[selection].update_username(new_username)
-                            print(tasks[selection].pretty_output())
+                        if new_username in workspace.usernames:
+                            task = workspace.tasks[selection]
+                            task.update_username(new_username)
+                            print(task.pretty_output())
                             break
                         else:
                             print("\nInvalid username. Please select valid "
@@ -408,10 +583,10 @@ def view_mine():
                         except ValueError:
                             print("Please try again")
                     # Update due date
-                    tasks[selection].update_due_date(new_due_date)
+                    workspace.tasks[selection].update_due_date(new_due_date)
                     print(new_due_date)
                     # Display update
-                    print(tasks[selection].pretty_output())
+                    print(workspace.tasks[selection].pretty_output())
                     break
                 else:
                     print("Please enter a valid option")
@@ -419,15 +594,15 @@ def view_mine():
         else:
             print("Please enter valid selction option")
     # Write changes to file
-    update_tasks_file()
+    workspace.update_tasks_file()
 
 
-def view_completed():
+def view_completed(workspace):
     ''' Finds and displays completed tasks'''
-    read_tasks()
+    workspace.read_tasks()
     print('\nVIEW COMPLTETED TASKS\n')
     num_completed = 0
-    for task in tasks:
+    for task in workspace.tasks:
         if task.is_completed() is True:
             num_completed += 1
             print('_' * 50)
@@ -436,11 +611,11 @@ def view_completed():
     print(f"\nNumber of completed tasks = {num_completed}.")
 
 
-def delete_task():
+def delete_task(workspace):
     '''Deletes requested task'''
-    read_tasks()
+    workspace.read_tasks()
     # Shows available tasks for selection
-    view_all()
+    view_all(workspace)
     while True:
         try:
             # Ensure number entered
@@ -451,14 +626,14 @@ def delete_task():
             print('Value entered was not a number. Please nter a number')
             print(error)
     # Check that task number exists
-    if int(del_index) in range(len(tasks) + 1):
+    if int(del_index) in range(len(workspace.tasks) + 1):
         # Temporray hold of data to be deleted
-        del_task = tasks[del_index].pretty_output()
+        del_task = workspace.tasks[del_index].pretty_output()
         # Delete from task list
-        del tasks[del_index]
+        del workspace.tasks[del_index]
         try:
             # Change file
-            update_tasks_file()
+            workspace.update_tasks_file()
             print("\nThe following task was deleted:\n")
             print(del_task)
             # Display update
@@ -469,40 +644,120 @@ def delete_task():
         print("Please select a valid task number")
 
 
-def find_completed():
-    # Finds and returns the number of completed tasks
-    tasks_complete = 0
-    for task in tasks:
-        if task.is_completed() is True:
-            tasks_complete += 1
-    return tasks_complete
-
-
-def find_overdue():
-    # Finds and returns the number of overdue tasks
-    num_overdue = 0
-    for task in tasks:
-        if (task.is_completed() is False) and (task.is_overdue() is True):
-            num_overdue += 1
-    return num_overdue
+def find_chunks(path, num_chunks):
+    '''
+    Splits a task file into byte ranges that start and end on
+    line boundaries, so that each range can be parsed on its own.
+    Args:
+        path (str):         The task file to split.
+        num_chunks (int):   The preferred number of ranges.
+    Returns:
+        chunks (list): (path, start, end) tuples covering the file.
+    '''
+    chunks = []
+    try:
+        size = os.path.getsize(path)
+        # Small files are not worth splitting, huge chunks use memory
+        chunk_size = min(max(size // num_chunks, min_chunk_size),
+                         max_chunk_size)
+        with open(path, "rb") as task_file:
+            start = 0
+            while start < size:
+                # Move to the end of the line that the split falls in
+                task_file.seek(start + chunk_size)
+                task_file.readline()
+                end = min(task_file.tell(), size)
+                chunks.append((path, start, end))
+                start = end
+    # A missing or unreadable file has no tasks to count
+    except OSError as error:
+        print(f"'{path}' could not be read")
+        print(error)
+    return chunks
 
 
-def find_tasks_per_user(total_tasks):
+def count_chunk(chunk):
+    '''
+    Parses one byte range of a task file into per-user counters.
+    Runs in a worker process, so only plain data goes in and out.
+    Args:
+        chunk (tuple): (path, start, end) as produced by find_chunks.
+    Returns:
+        user_counts (dict): username -> [assigned, completed, overdue]
+    '''
+    path, start, end = chunk
+    today = date.today()
+    # Many tasks share a due date: only parse each date once
+    overdue_dates = {}
+    user_counts = {}
+    with open(path, "rb") as task_file:
+        task_file.seek(start)
+        data = task_file.read(end - start)
+    # Split on newlines only, as reading the file line by line does
+    for line in data.decode("utf-8").split("\n"):
+        line = line.removesuffix("\r")
+        # Skip blank lines left behind by appending to the file
+        if not line:
+            continue
+        words = line.split(", ")
+        counts = user_counts.get(words[0])
+        if counts is None:
+            counts = user_counts[words[0]] = [0, 0, 0]
+        counts[0] += 1
+        if words[5] != "No":
+            counts[1] += 1
+            continue
+        due_date = words[4]
+        if due_date not in overdue_dates:
+            overdue_dates[due_date] = (
+                datetime.strptime(due_date, "%d %b %Y").date() < today)
+        if overdue_dates[due_date]:
+            counts[2] += 1
+    return user_counts
+
+
+def merge_counts(partials):
+    '''Adds up the per-user counters returned by count_chunk'''
+    user_counts = {}
+    for partial in partials:
+        for name, counts in partial.items():
+            totals = user_counts.setdefault(name, [0, 0, 0])
+            for i, count in enumerate(counts):
+                totals[i] += count
+    return user_counts
+
+
+def count_tasks(task_paths, workers=None):
+    '''
+    Counts assigned, completed and overdue tasks per user.
+    Task files are split into line-aligned chunks which are
+    counted in parallel and then merged.
+    Args:
+        task_paths (list):  Task files (or shards of one) to count.
+        workers (int):      Number of processes. Defaults to all cores.
+    Returns:
+        user_counts (dict): username -> [assigned, completed, overdue]
+    '''
+    workers = workers or os.cpu_count() or 1
+    chunks = []
+    for path in task_paths:
+        chunks.extend(find_chunks(path, workers * 4))
+    # Starting processes costs more than counting a small amount of data
+    total_size = sum(end - start for _, start, end in chunks)
+    if workers == 1 or len(chunks) <= 1 or total_size <= min_chunk_size:
+        return merge_counts(map(count_chunk, chunks))
+    # No more processes than there are chunks to count
+    with ProcessPoolExecutor(max_workers=min(workers,
+                                             len(chunks))) as executor:
+        return merge_counts(executor.map(count_chunk, chunks))
+
+
+def find_tasks_per_user(usernames, total_tasks, user_counts):
     '''Finds the stats of all tasks as grouped by users'''
     all_users = []
-    # Outside loop: all users
     for name in usernames:
-        num_tasks = 0
-        comp_tasks = 0
-        num_overdue = 0
-        # Inside loop: all tasks associated with ouside user
-        for task in tasks:
-            if task.get_username() == name:
-                num_tasks += 1
-                if task.is_completed():
-                    comp_tasks += 1
-                elif task.is_overdue():
-                    num_overdue += 1
+        num_tasks, comp_tasks, num_overdue = user_counts.get(name,
+                                                             [0, 0, 0])
         # Prevent devision by 0
         percent_assigned = 0
         percent_complete = 0
@@ -528,17 +783,29 @@ def find_tasks_per_user(total_tasks):
     return all_users
 
 
-def display_stats():
-    # Ensure updated tasks
-    read_tasks()
+def display_stats(workspace, task_paths=None, workers=None):
+    '''
+    Displays task and user statistics and writes them to
+    task_overview.txt and user_overview.txt in the workspace.
+    Args:
+        workspace (Workspace): The team to report on.
+        task_paths (list):  Task files to report on, e.g. shards of
+                            one large file. Defaults to tasks.txt.
+        workers (int):      Number of processes. Defaults to all cores.
+    '''
+    # Count straight from the files so large ones are split over cores
+    user_counts = count_tasks(task_paths or [workspace.path_tasks], workers)
     # Determine total number of tasks
-    total_tasks = len(tasks)
-    num_complete = find_completed()
+    total_tasks = sum(counts[0] for counts in user_counts.values())
+    num_complete = sum(counts[1] for counts in user_counts.values())
     num_incomplete = total_tasks - num_complete
-    num_overdue = find_overdue()
-    # Calculate percentages
-    percent_incomplete = round((num_incomplete/total_tasks)*100, 2)
-    percent_overdue = round((num_overdue/total_tasks)*100, 2)
+    num_overdue = sum(counts[2] for counts in user_counts.values())
+    # Calculate percentages, preventing devision by 0 for a new team
+    percent_incomplete = 0
+    percent_overdue = 0
+    if total_tasks > 0:
+        percent_incomplete = round((num_incomplete/total_tasks)*100, 2)
+        percent_overdue = round((num_overdue/total_tasks)*100, 2)
     # Reader-freindly display
     tasks_stats = (f"TASKS STATS {date.today()}\n"
                    f"Total tasks:\t\t{total_tasks}\n"
@@ -553,11 +820,12 @@ def display_stats():
 
     # Get users statistics
     # Ensure updated list
-    read_users()
+    workspace.read_users()
     # Determine total number of users
-    total_users = len(usernames)
+    total_users = len(workspace.usernames)
     # Get 2D list of task attributes grouped per user
-    user_tasks = find_tasks_per_user(total_tasks)
+    user_tasks = find_tasks_per_user(workspace.usernames, total_tasks,
+                                     user_counts)
     # Assign headings for table
     headings = ('Username', 'Assigned tasks', 'Completed', 'Overdue',
                 'Assigned(%)', 'Complete(%)', 'Incomplete(%)', 'Overdue(%)')
@@ -570,9 +838,14 @@ def display_stats():
     # Print user stats table
     print(tabulate(user_tasks, headers=headings, tablefmt="grid",
                    stralign="center", numalign="center"))
+    # Write reports next to the workspace's own files
+    path_task_overview = os.path.join(workspace.directory,
+                                      "task_overview.txt")
+    path_user_overview = os.path.join(workspace.directory,
+                                      "user_overview.txt")
     # Write task report to file
     try:
-        with open('./task_overview.txt', "w") as task_overview:
+        with open(path_task_overview, "w") as task_overview:
             task_overview.write(tasks_stats)
     except FileNotFoundError as error:
         print("task_overview not found")
@@ -580,9 +853,9 @@ def display_stats():
 
     # Write user report to file
     try:
-        with open('./user_overview.txt', "w") as user_overview:
+        with open(path_user_overview, "w") as user_overview:
             user_overview.write(output)
-        with open('./user_overview.txt', "a") as user_overview:
+        with open(path_user_overview, "a") as user_overview:
             user_overview.write(tabulate(user_tasks, headers=headings,
                                          tablefmt="grid", stralign="center",
                                          numalign="center"))
@@ -610,82 +883,92 @@ user_menu = {'a': '- add task',
              }
 
 
-# ==== Login Section ====
-read_users()
-
-# Allow repeated attempts to login until valid entry
-while True:
-    print("\nLOGIN")
-    # Request user login details
-    username = input("Please enter your username: \n\t")
-    password = input("Please enter your password: \n\t")
-    # Find username in directory
-    if username in usernames:
-        if usernames[username] == password:
-            # End loop if username found and
-            # Password matches
-            break
-        else:
-            # No match
-            print("Invalid password")
-    else:
-        # Username not in dictionary
-        print("Username was not found. Please try again.")
-
-while True:
-    print("\nMENU")
-    # Display different menu options depending on username
-    if username == 'admin':
-        options = admin_menu
-    else:
-        options = user_menu
-    for selections in options:
-        print(f"{selections}\t{options[selections]}")
+# Loaded team workspaces, shared by everyone using this process
+workspaces = WorkspaceStore()
 
-    # Make sure that the user input is converted to lower case.
-    menu = input('\nSelect one of the above options:').lower()
 
-    if menu == 'r':
-        if username == 'admin':
-            '''This code block request new user details and writes
-                them to the user file upon password confirmation'''
-            print("\nREGISTER NEW USER")
-            reg_user()
+# ==== Login Section ====
+if __name__ == "__main__":
+    # Allow repeated attempts to login until valid entry
+    while True:
+        print("\nLOGIN")
+        # Request the team directory, blank for the current directory
+        directory = input("Please enter your team workspace "
+                          "(blank for default): \n\t") or "."
+        workspace = workspaces.get(directory)
+        if workspace is None:
+            print("Please enter a valid workspace.")
+            continue
+        # Request user login details
+        username = input("Please enter your username: \n\t")
+        password = input("Please enter your password: \n\t")
+        # Find username in directory
+        if username in workspace.usernames:
+            if workspace.usernames[username] == password:
+                # End loop if username found and
+                # Password matches
+                break
+            else:
+                # No match
+                print("Invalid password")
         else:
-            print('Only admin is allowed to register a new user.')
-    elif menu == 'a':
-        add_task()
-
-    elif menu == 'va':
-        view_all()
-
-    elif menu == 'vm':
-        view_mine()
+            # Username not in dictionary
+            print("Username was not found. Please try again.")
 
-    elif menu == 'e':
-        print('Goodbye!!!')
-        exit()
-
-    # Admin only options
-    # Even if non-admin users enter these options
-    # without menu options displayed code will not execute
-    elif menu == 'vc':
+    while True:
+        print("\nMENU")
+        # Display different menu options depending on username
         if username == 'admin':
-            view_completed()
+            options = admin_menu
         else:
-            print('Only admin can view completed tasks.')
+            options = user_menu
+        for selections in options:
+            print(f"{selections}\t{options[selections]}")
+
+        # Make sure that the user input is converted to lower case.
+        menu = input('\nSelect one of the above options:').lower()
+
+        if menu == 'r':
+            if username == 'admin':
+                '''This code block request new user details and writes
+                    them to the user file upon password confirmation'''
+                print("\nREGISTER NEW USER")
+                reg_user(workspace)
+            else:
+                print('Only admin is allowed to register a new user.')
+        elif menu == 'a':
+            add_task(workspace)
+
+        elif menu == 'va':
+            view_all(workspace)
+
+        elif menu == 'vm':
+            view_mine(workspace, username)
+
+        elif menu == 'e':
+            print('Goodbye!!!')
+            exit()
+
+        # Admin only options
+        # Even if non-admin users enter these options
+        # without menu options displayed code will not execute
+        elif menu == 'vc':
+            if username == 'admin':
+                view_completed(workspace)
+            else:
+                print('Only admin can view completed tasks.')
 
-    elif menu == 'del':
-        if username == 'admin':
-            delete_task()
-        else:
-            print('Only admin is allowed to delete tasks.')
-    elif menu == 'ds':
-        if username == 'admin':
-            display_stats()
-        else:
-            print("Only admin can display statistics")
-            print("Please select another option")
+        elif menu == 'del':
+            if username == 'admin':
+                delete_task(workspace)
+            else:
+                print('Only admin is allowed to delete tasks.')
+        elif menu == 'ds':
+            if username == 'admin':
+                display_stats(workspace)
+            else:
+                print("Only admin can display statistics")
+                print("Please select another option")
 
-    else:
-        print("You have entered an invalid input. Please try again")
+        else:
+            print("You have entered an invalid input. Please try again")